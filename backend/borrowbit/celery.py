@@ -0,0 +1,10 @@
+"""Celery application for BorrowBit background tasks."""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'borrowbit.settings')
+
+app = Celery('borrowbit')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -0,0 +1,9 @@
+"""Root URL configuration for BorrowBit."""
+from django.contrib import admin
+from django.urls import include, path
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('api/orders/', include('orders.urls')),
+    path('api/payments/', include('payments.urls')),
+]
@@ -0,0 +1,8 @@
+"""WSGI config for BorrowBit."""
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'borrowbit.settings')
+
+application = get_wsgi_application()
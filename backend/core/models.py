@@ -0,0 +1,28 @@
+"""Shared abstract models for all BorrowBit apps."""
+import uuid
+
+from django.db import models
+
+
+class BaseModel(models.Model):
+    """
+    Abstract base for all domain models.
+
+    Gives every table a UUID primary key, created/updated timestamps and
+    soft-delete support via the ``is_deleted`` flag.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    is_active = models.BooleanField(default=True)
+    is_deleted = models.BooleanField(default=False)
+
+    class Meta:
+        abstract = True
+        ordering = ['-created_at']
+
+    def soft_delete(self):
+        """Mark the row as deleted without removing it from the table."""
+        self.is_deleted = True
+        self.is_active = False
+        self.save(update_fields=['is_deleted', 'is_active', 'updated_at'])
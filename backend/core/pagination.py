@@ -0,0 +1,57 @@
+"""Pagination helpers shared across the API apps."""
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connection, transaction
+from django.db.utils import OperationalError
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class PkOnlyPaginator(DjangoPaginator):
+    """
+    Django paginator whose COUNT runs over a pk-only projection, so the
+    count query carries none of the joins or columns the page query
+    needs for rendering.
+    """
+
+    @cached_property
+    def count(self):
+        try:
+            return self.object_list.values('pk').count()
+        except (AttributeError, TypeError):
+            return super().count
+
+
+class PkCountPageNumberPagination(PageNumberPagination):
+    """Standard page-number pagination backed by the pk-only count."""
+    django_paginator_class = PkOnlyPaginator
+
+
+class TimeBoundedPaginator(DjangoPaginator):
+    """
+    Paginator whose COUNT runs under a short statement_timeout. On large
+    tables an exact count can dominate list latency; when Postgres aborts
+    the count we fall back to a large sentinel so pagination still renders
+    instead of the whole request inheriting the count's tail latency.
+    """
+
+    COUNT_TIMEOUT_MS = 200
+    COUNT_SENTINEL = 9999999999
+
+    @cached_property
+    def count(self):
+        if connection.vendor != 'postgresql':
+            return super().count
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                # SET LOCAL scopes the timeout to this transaction only.
+                cursor.execute(
+                    'SET LOCAL statement_timeout TO %d' % self.COUNT_TIMEOUT_MS
+                )
+                return self.object_list.values('pk').count()
+        except OperationalError:
+            return self.COUNT_SENTINEL
+
+
+class TimeBoundedPageNumberPagination(PageNumberPagination):
+    """Page-number pagination whose count is bounded by a timeout."""
+    django_paginator_class = TimeBoundedPaginator
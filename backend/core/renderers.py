@@ -0,0 +1,19 @@
+"""Fast JSON rendering for the API."""
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson. Handles datetime/UUID natively and
+    falls back to str() for Decimal and other types, several times faster
+    than the stdlib json encoder on large payloads.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=str, option=orjson.OPT_NAIVE_UTC)
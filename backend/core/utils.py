@@ -0,0 +1,72 @@
+"""Shared helpers for API responses and caching."""
+import logging
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TIMEOUT = 300
+
+
+def success_response(message, data=None, status_code=status.HTTP_200_OK):
+    """Standard success envelope used by every BorrowBit endpoint."""
+    return Response(
+        {'success': True, 'message': message, 'data': data},
+        status=status_code,
+    )
+
+
+def error_response(message, errors=None, status_code=status.HTTP_400_BAD_REQUEST):
+    """Standard error envelope used by every BorrowBit endpoint."""
+    return Response(
+        {'success': False, 'message': message, 'errors': errors},
+        status=status_code,
+    )
+
+
+def cache_key_generator(prefix, suffix):
+    """Build a namespaced cache key like ``payment_summary:<user_id>``."""
+    return f'{prefix}:{suffix}'
+
+
+def get_cache_data(key):
+    """Fetch a value from the cache, returning None on any cache error."""
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"Cache get failed for {key}: {str(e)}")
+        return None
+
+
+def set_cache_data(key, data, timeout=DEFAULT_CACHE_TIMEOUT):
+    """Store a value in the cache, swallowing cache errors."""
+    try:
+        cache.set(key, data, timeout)
+    except Exception as e:
+        logger.warning(f"Cache set failed for {key}: {str(e)}")
+
+
+def delete_cache_data(key):
+    """Remove a key from the cache, swallowing cache errors."""
+    try:
+        cache.delete(key)
+    except Exception as e:
+        logger.warning(f"Cache delete failed for {key}: {str(e)}")
+
+
+def delete_cache_pattern(pattern):
+    """Remove every key matching a glob pattern (django-redis only)."""
+    try:
+        cache.delete_pattern(pattern)
+    except Exception as e:
+        logger.warning(f"Cache delete_pattern failed for {pattern}: {str(e)}")
+
+
+def delete_cache_many(keys):
+    """Remove several keys from the cache in one round trip."""
+    try:
+        cache.delete_many(keys)
+    except Exception as e:
+        logger.warning(f"Cache delete_many failed for {keys}: {str(e)}")
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.17 on 2026-08-28 18:51
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RentalOrder',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('order_number', models.CharField(editable=False, max_length=30, unique=True)),
+                ('status', models.CharField(choices=[('DRAFT', 'Draft'), ('CONFIRMED', 'Confirmed'), ('PICKED_UP', 'Picked Up'), ('RETURNED', 'Returned'), ('COMPLETED', 'Completed'), ('CANCELLED', 'Cancelled')], default='DRAFT', max_length=20)),
+                ('rental_start_date', models.DateTimeField()),
+                ('rental_end_date', models.DateTimeField()),
+                ('subtotal', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('tax_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('deposit_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('notes', models.TextField(blank=True)),
+            ],
+            options={
+                'db_table': 'rental_orders',
+            },
+        ),
+        migrations.CreateModel(
+            name='RentalOrderItem',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('quantity', models.PositiveIntegerField(default=1)),
+                ('unit_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('total_price', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('deposit_per_unit', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+            ],
+            options={
+                'db_table': 'rental_order_items',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-28 19:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rentalorder',
+            index=models.Index(fields=['customer', 'is_deleted', '-created_at'], name='idx_order_customer_created'),
+        ),
+        migrations.AddIndex(
+            model_name='rentalorder',
+            index=models.Index(fields=['status', 'is_deleted', '-created_at'], name='idx_order_status_created'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-28 19:44
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_rentalorder_idx_order_customer_created_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # No-op off PostgreSQL; required before any gin_trgm_ops index.
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='rentalorder',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['order_number'], name='ro_ordernum_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
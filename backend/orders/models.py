@@ -0,0 +1,81 @@
+"""Rental orders and their line items."""
+import uuid
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+from core.models import BaseModel
+
+
+class RentalOrder(BaseModel):
+    """A rental order created from the customer's cart."""
+    STATUS_CHOICES = [
+        ('DRAFT', 'Draft'),
+        ('CONFIRMED', 'Confirmed'),
+        ('PICKED_UP', 'Picked Up'),
+        ('RETURNED', 'Returned'),
+        ('COMPLETED', 'Completed'),
+        ('CANCELLED', 'Cancelled'),
+    ]
+
+    order_number = models.CharField(max_length=30, unique=True, editable=False)
+    customer = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name='rental_orders'
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='DRAFT')
+    rental_start_date = models.DateTimeField()
+    rental_end_date = models.DateTimeField()
+    subtotal = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    tax_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    deposit_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    notes = models.TextField(blank=True)
+
+    class Meta:
+        db_table = 'rental_orders'
+        indexes = [
+            # The two (filter, sort) shapes the list endpoints actually
+            # run: a customer's orders and staff status dashboards, both
+            # ordered newest first.
+            models.Index(
+                name='idx_order_customer_created',
+                fields=['customer', 'is_deleted', '-created_at'],
+            ),
+            models.Index(
+                name='idx_order_status_created',
+                fields=['status', 'is_deleted', '-created_at'],
+            ),
+            # Trigram index serving the fuzzy order-number search; the
+            # search path scores with TrigramSimilarity instead of
+            # unindexable chained ILIKEs.
+            GinIndex(
+                name='ro_ordernum_trgm',
+                fields=['order_number'],
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
+
+    def __str__(self):
+        return self.order_number
+
+    def save(self, *args, **kwargs):
+        if not self.order_number:
+            self.order_number = f'RO-{uuid.uuid4().hex[:10].upper()}'
+        super().save(*args, **kwargs)
+
+
+class RentalOrderItem(BaseModel):
+    """A single product line on a rental order."""
+    order = models.ForeignKey(RentalOrder, on_delete=models.CASCADE, related_name='items')
+    product = models.ForeignKey('products.Product', on_delete=models.PROTECT, related_name='order_items')
+    quantity = models.PositiveIntegerField(default=1)
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+    total_price = models.DecimalField(max_digits=12, decimal_places=2)
+    deposit_per_unit = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'rental_order_items'
+
+    def __str__(self):
+        return f'{self.order.order_number} - {self.product.name} x{self.quantity}'
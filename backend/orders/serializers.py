@@ -0,0 +1,46 @@
+"""Serializers for the rental orders API."""
+from rest_framework import serializers
+
+from .models import RentalOrder, RentalOrderItem
+
+
+class RentalOrderItemSerializer(serializers.ModelSerializer):
+    product_name = serializers.CharField(source='product.name', read_only=True)
+    product_sku = serializers.CharField(source='product.sku', read_only=True)
+    category_name = serializers.CharField(source='product.category.name', read_only=True)
+
+    class Meta:
+        model = RentalOrderItem
+        fields = [
+            'id', 'product', 'product_name', 'product_sku', 'category_name',
+            'quantity', 'unit_price', 'total_price', 'deposit_per_unit',
+        ]
+        read_only_fields = ['id']
+
+
+class RentalOrderListSerializer(serializers.ModelSerializer):
+    """Compact representation used on list endpoints."""
+    customer_email = serializers.EmailField(source='customer.email', read_only=True)
+
+    class Meta:
+        model = RentalOrder
+        fields = [
+            'id', 'order_number', 'customer_email', 'status', 'total_amount',
+            'rental_start_date', 'rental_end_date', 'created_at',
+        ]
+
+
+class RentalOrderSerializer(serializers.ModelSerializer):
+    """Full representation used on detail endpoints and mutations."""
+    customer_email = serializers.EmailField(source='customer.email', read_only=True)
+    items = RentalOrderItemSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = RentalOrder
+        fields = [
+            'id', 'order_number', 'customer', 'customer_email', 'status',
+            'rental_start_date', 'rental_end_date', 'subtotal', 'tax_amount',
+            'deposit_amount', 'total_amount', 'notes', 'items',
+            'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'order_number', 'created_at', 'updated_at']
@@ -0,0 +1,44 @@
+"""Background tasks for order lifecycle transitions."""
+import logging
+
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def cancel_order_task(order_id):
+    """
+    Cancel a DRAFT order: release its reservations, flip the status and
+    fail any pending payments. Runs off the request thread — the cancel
+    redirect only needs an acknowledgement, not the writes. The row lock
+    plus DRAFT re-check makes the task idempotent, so a double-enqueued
+    cancel (or a cancel racing the paid webhook) is a no-op the second
+    time through.
+    """
+    from orders.views import _release_order_reservations
+
+    from .models import RentalOrder
+
+    with transaction.atomic():
+        order = (
+            RentalOrder.objects.select_for_update()
+            .filter(id=order_id, status='DRAFT', is_deleted=False)
+            .first()
+        )
+        if order is None:
+            logger.info("cancel_order_task: order %s already left DRAFT", order_id)
+            return
+        # Three writes total: bulk reservation release, one order UPDATE,
+        # one payment UPDATE — no per-row save() round trips.
+        _release_order_reservations(order)
+        RentalOrder.objects.filter(pk=order.pk).update(
+            status='CANCELLED', updated_at=timezone.now()
+        )
+        order.payments.filter(status='PENDING').update(
+            status='FAILED',
+            notes='Payment cancelled by customer',
+            updated_at=timezone.now(),
+        )
@@ -0,0 +1,15 @@
+"""URL routes for the rental orders API."""
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from . import views
+
+router = DefaultRouter()
+router.register(r'orders', views.RentalOrderViewSet, basename='rental-order')
+
+urlpatterns = [
+    path('', include(router.urls)),
+    path('webhooks/stripe/', views.StripeWebhookView.as_view(), name='orders-stripe-webhook'),
+    path('payment/success/', views.PaymentSuccessView.as_view(), name='payment-success'),
+    path('payment/cancel/', views.PaymentCancelView.as_view(), name='payment-cancel'),
+]
@@ -0,0 +1,592 @@
+"""Viewsets, checkout flow and Stripe callbacks for rental orders."""
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from decimal import Decimal
+from functools import lru_cache
+
+import stripe
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Max, Prefetch, When
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+
+from core.mixins import RoleScopedQuerysetMixin, apply_trigram_search
+from core.pagination import PkCountPageNumberPagination
+from core.utils import (
+    cache_key_generator,
+    error_response,
+    get_cache_data,
+    set_cache_data,
+    success_response,
+)
+from payments.models import Payment, PaymentGateway
+from payments.tasks import process_payment_confirmed_side_effects
+from products.models import Product, ProductPricing
+
+from .models import RentalOrder, RentalOrderItem
+from .serializers import RentalOrderListSerializer, RentalOrderSerializer
+from .tasks import cancel_order_task
+
+logger = logging.getLogger(__name__)
+
+# GST applied to the rental subtotal.
+TAX_RATE = Decimal('0.085')
+
+# Hourly price fallback for products with no active pricing rule, as a
+# fraction of the deposit. Built once, not per cart line.
+_DEPOSIT_HOURLY_FALLBACK_RATIO = Decimal('0.1')
+
+# Rental durations are priced to four decimal places of an hour.
+_DURATION_QUANT = Decimal('0.0001')
+
+# Shape of a Stripe checkout session id; anything else is rejected before
+# it costs a Stripe round trip (bots and stale tabs hit the success URL
+# with arbitrary values).
+_STRIPE_SESSION_RE = re.compile(r'^cs_(test|live)_[A-Za-z0-9]{20,}$')
+
+
+# Stripe is configured once at import. Re-assigning stripe.api_key inside
+# request handlers is a module-global write race under concurrency, and the
+# shared RequestsClient keeps one HTTPS connection pool alive, saving a TLS
+# handshake per outbound call.
+stripe.api_key = settings.STRIPE_SECRET_KEY
+stripe.default_http_client = stripe.RequestsClient()
+
+
+def _release_order_reservations(order):
+    """
+    Return the reserved stock for every line on the order with a single
+    UPDATE via the product manager's bulk release.
+    """
+    deltas = defaultdict(int)
+    for product_id, quantity in order.items.values_list('product_id', 'quantity'):
+        deltas[product_id] += quantity
+    Product.objects.bulk_release(deltas)
+
+
+@lru_cache(maxsize=1)
+def _get_stripe_gateway_id():
+    """
+    PK of the STRIPE gateway row, resolved once per process. The row is
+    effectively static configuration, so there is no point paying a
+    SELECT (or get_or_create race) on every checkout; a process restart
+    picks up a replaced row.
+    """
+    gateway, _ = PaymentGateway.objects.get_or_create(
+        gateway_type='STRIPE', defaults={'name': 'Stripe'}
+    )
+    return gateway.pk
+
+
+@lru_cache(maxsize=1)
+def _get_webhook_secret():
+    """
+    Stripe webhook secret, resolved once per process. Every settings
+    attribute read goes through LazySettings.__getattr__; under webhook
+    bursts there is no reason to pay that per event for a value that
+    only changes on deploy.
+    """
+    return settings.STRIPE_WEBHOOK_SECRET
+
+
+class RentalOrderViewSet(RoleScopedQuerysetMixin, viewsets.ModelViewSet):
+    """CRUD plus checkout and cancellation flows for rental orders."""
+    queryset = RentalOrder.objects.filter(is_deleted=False)
+    serializer_class = RentalOrderSerializer
+    pagination_class = PkCountPageNumberPagination
+    ordering_fields = ['created_at', 'total_amount', 'rental_start_date']
+
+    # Searched with trigram similarity instead of DRF's SearchFilter,
+    # whose cross-FK search_fields compile to unindexable chained ILIKEs.
+    SEARCH_COLUMNS = ('order_number', 'customer__email')
+
+    ACTION_SERIALIZERS = {
+        'list': RentalOrderListSerializer,
+    }
+
+    def get_serializer_class(self):
+        return self.ACTION_SERIALIZERS.get(self.action, RentalOrderSerializer)
+
+    def get_base_queryset(self):
+        queryset = RentalOrder.objects.filter(is_deleted=False).select_related('customer')
+        if self.action == 'list':
+            # The list serializer renders a fixed handful of columns; skip
+            # notes and the money breakdown fields it never touches.
+            queryset = queryset.only(
+                'id', 'order_number', 'status', 'total_amount',
+                'rental_start_date', 'rental_end_date', 'created_at',
+                'customer_id', 'customer__email',
+            )
+            search = self.request.query_params.get('search')
+            if search:
+                queryset = apply_trigram_search(queryset, search, self.SEARCH_COLUMNS)
+        else:
+            # Detail views render nested items and payments; the list
+            # serializer touches neither, so its queryset stays lean. The
+            # category join rides the items prefetch instead of a separate
+            # 'items__product__category' pass, which would run the items
+            # prefetch twice.
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'items',
+                    queryset=RentalOrderItem.objects.select_related(
+                        'product', 'product__category'
+                    ),
+                ),
+                Prefetch('payments', queryset=Payment.objects.select_related('gateway')),
+            )
+        return queryset
+
+    @action(detail=False, methods=['post'])
+    def create_from_cart(self, request):
+        """Create an order from the submitted cart and open a Stripe checkout."""
+        try:
+            cart_items = request.data.get('cart_items') or []
+            rental_start_date = parse_datetime(request.data.get('rental_start_date', ''))
+            rental_end_date = parse_datetime(request.data.get('rental_end_date', ''))
+            if not cart_items or not rental_start_date or not rental_end_date:
+                return error_response(
+                    'cart_items, rental_start_date and rental_end_date are required',
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+            if rental_end_date <= rental_start_date:
+                return error_response(
+                    'rental_end_date must be after rental_start_date',
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+            # Rental duration in hours drives the hourly pricing rules.
+            # Computed as Decimal once, not re-parsed per cart line.
+            duration_hours = (
+                Decimal((rental_end_date - rental_start_date).total_seconds())
+                / Decimal(3600)
+            ).quantize(_DURATION_QUANT)
+
+            with transaction.atomic():
+                # Built in memory (the UUID pk exists before save), so the
+                # totals computed below ride the one INSERT instead of an
+                # INSERT followed by an UPDATE.
+                order = RentalOrder(
+                    customer=request.user,
+                    rental_start_date=rental_start_date,
+                    rental_end_date=rental_end_date,
+                    status='DRAFT',
+                )
+                subtotal = Decimal('0')
+                deposit_total = Decimal('0')
+                order_items = []
+                reservations = defaultdict(int)
+                # Two queries for the whole cart instead of two per line:
+                # all products in one IN query, their hourly pricing rules in
+                # one prefetch. Keyed by str since cart payloads carry the
+                # UUIDs as strings. The rows are locked for the availability
+                # check below; skip_locked makes a contended cart fail fast
+                # with a retry hint instead of queueing behind another
+                # checkout's transaction.
+                product_ids = [item['product_id'] for item in cart_items]
+                products_by_id = {
+                    str(pk): product
+                    for pk, product in Product.objects.filter(
+                        is_deleted=False, is_rentable=True
+                    ).select_for_update(skip_locked=True).prefetch_related(
+                        Prefetch(
+                            'pricing_rules',
+                            queryset=ProductPricing.objects.filter(
+                                customer_type='REGULAR',
+                                duration_type='HOURLY',
+                                is_active=True,
+                            ),
+                            to_attr='hourly_regular',
+                        )
+                    ).in_bulk(product_ids).items()
+                }
+                requested_ids = {str(pid) for pid in product_ids}
+                missing_ids = requested_ids - products_by_id.keys()
+                if missing_ids:
+                    # A row can be absent for two very different reasons:
+                    # it fails the filter (deleted, non-rentable, never
+                    # existed) or another checkout holds its lock and
+                    # skip_locked dropped it. Re-check without locks so
+                    # invalid carts get the precise 400 and only genuinely
+                    # contended products get the retry hint.
+                    locked_ids = set(map(str, Product.objects.filter(
+                        pk__in=missing_ids, is_deleted=False, is_rentable=True
+                    ).values_list('pk', flat=True)))
+                    unavailable = missing_ids - locked_ids
+                    if unavailable:
+                        return error_response(
+                            f"Product {sorted(unavailable)[0]} is not available",
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                        )
+                    raise ValidationError(
+                        'Another order is being processed for one of these '
+                        'products, please retry.'
+                    )
+                for item_data in cart_items:
+                    product = products_by_id[str(item_data['product_id'])]
+                    quantity = int(item_data.get('quantity', 1))
+                    pricing = product.hourly_regular[0] if product.hourly_regular else None
+                    unit_price = (
+                        pricing.price if pricing
+                        else product.deposit_amount * _DEPOSIT_HOURLY_FALLBACK_RATIO
+                    )
+                    item_total = unit_price * duration_hours * quantity
+                    order_items.append(RentalOrderItem(
+                        order=order,
+                        product=product,
+                        quantity=quantity,
+                        unit_price=unit_price,
+                        total_price=item_total,
+                        deposit_per_unit=product.deposit_amount,
+                    ))
+                    reservations[product.pk] += quantity
+                    subtotal += item_total
+                    deposit_total += product.deposit_amount * quantity
+
+                for pk, reserve_qty in reservations.items():
+                    product = products_by_id[str(pk)]
+                    if product.available_quantity < reserve_qty:
+                        raise ValidationError(
+                            f'Only {product.available_quantity} units of '
+                            f'{product.name} available.'
+                        )
+                order.subtotal = subtotal
+                order.tax_amount = subtotal * TAX_RATE
+                order.deposit_amount = deposit_total
+                order.total_amount = subtotal + order.tax_amount + deposit_total
+                order.save()
+
+                # One multi-row INSERT for the items, then one Case/When
+                # UPDATE for the whole inventory move — race-safe F()
+                # arithmetic, no per-product statements.
+                RentalOrderItem.objects.bulk_create(order_items)
+                reserve = Case(
+                    *[When(pk=pk, then=qty) for pk, qty in reservations.items()],
+                    output_field=IntegerField(),
+                )
+                Product.objects.filter(pk__in=reservations).update(
+                    available_quantity=F('available_quantity') - reserve,
+                    reserved_quantity=F('reserved_quantity') + reserve,
+                )
+
+                payment = Payment.objects.create(
+                    user=request.user,
+                    order=order,
+                    gateway_id=_get_stripe_gateway_id(),
+                    transaction_type='RENTAL_PAYMENT',
+                    status='PENDING',
+                    amount=order.subtotal,
+                    tax_amount=order.tax_amount,
+                    total_amount=order.total_amount,
+                )
+
+            # The Stripe round trip runs after the first transaction commits:
+            # holding product/order row locks across a multi-hundred-ms HTTPS
+            # call serializes concurrent checkouts (and worse during Stripe
+            # outages). On failure a compensating update releases the stock.
+            try:
+                checkout_session = stripe.checkout.Session.create(
+                    payment_method_types=['card'],
+                    line_items=[{
+                        'price_data': {
+                            'currency': 'inr',
+                            'product_data': {'name': f'Rental order {order.order_number}'},
+                            'unit_amount': int(order.total_amount * 100),
+                        },
+                        'quantity': 1,
+                    }],
+                    mode='payment',
+                    success_url=(
+                        f'{settings.FRONTEND_URL}/payment/success/'
+                        '?session_id={CHECKOUT_SESSION_ID}'
+                    ),
+                    cancel_url=f'{settings.FRONTEND_URL}/payment/cancel/?order_id={order.id}',
+                    metadata={
+                        'order_id': str(order.id),
+                        'payment_id': payment.payment_id,
+                    },
+                )
+            except Exception as e:
+                logger.error(f"Stripe checkout session failed for {order.order_number}: {str(e)}")
+                with transaction.atomic():
+                    Payment.objects.filter(pk=payment.pk).update(
+                        status='FAILED', notes='Stripe checkout session creation failed'
+                    )
+                    Product.objects.bulk_release(reservations)
+                return error_response(
+                    'Failed to start checkout',
+                    status_code=status.HTTP_502_BAD_GATEWAY,
+                )
+            logger.debug("checkout session created id=%s", checkout_session.id)
+            Payment.objects.filter(pk=payment.pk).update(
+                gateway_transaction_id=checkout_session.id,
+                gateway_response={'session_id': checkout_session.id},
+            )
+
+            return success_response('Order created', {
+                'order_id': str(order.id),
+                'order_number': order.order_number,
+                'total_amount': str(order.total_amount),
+                'checkout_url': checkout_session.url,
+            })
+        except ValidationError as e:
+            return error_response(str(e), status_code=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Order creation failed: {str(e)}")
+            return error_response(
+                'Failed to create order',
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=['get'])
+    def my_orders(self, request):
+        """The requesting customer's orders, paginated with conditional-GET."""
+        base = RentalOrder.objects.filter(customer=request.user, is_deleted=False)
+        # The ETag tracks the newest updated_at plus the row count, so
+        # both edits and creates/deletes change it immediately — polling
+        # clients get 304s with zero serialization work. That replaces
+        # the old whole-list payload cache, which grew unbounded with
+        # order history and went stale the moment anything changed.
+        agg = base.aggregate(m=Max('updated_at'), c=Count('id'))
+        etag = hashlib.md5(
+            f"{request.user.id}:{agg['m']}:{agg['c']}".encode()
+        ).hexdigest()
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            return HttpResponseNotModified()
+        # Column-pruned header projection: the customer view renders no
+        # nested items or payments.
+        orders = base.only(
+            'id', 'order_number', 'status', 'total_amount',
+            'rental_start_date', 'rental_end_date', 'created_at',
+        ).order_by('-created_at')
+        page = self.paginate_queryset(orders)
+        rows = page if page is not None else orders
+        data = [
+            {
+                'id': str(order.id),
+                'order_number': order.order_number,
+                'status': order.status,
+                'total_amount': str(order.total_amount),
+                'rental_start_date': order.rental_start_date.isoformat(),
+                'rental_end_date': order.rental_end_date.isoformat(),
+                'created_at': order.created_at.isoformat(),
+            }
+            for order in rows
+        ]
+        if page is not None:
+            data = {
+                'count': self.paginator.page.paginator.count,
+                'next': self.paginator.get_next_link(),
+                'previous': self.paginator.get_previous_link(),
+                'results': data,
+            }
+        response = success_response('Orders retrieved', data)
+        response['ETag'] = etag
+        return response
+
+    @action(detail=True, methods=['post'])
+    def cancel_order(self, request, pk=None):
+        """Cancel a draft/confirmed order and release its reservations."""
+        try:
+            order = RentalOrder.objects.get(
+                id=pk, customer=request.user, is_deleted=False
+            )
+        except RentalOrder.DoesNotExist:
+            return error_response('Order not found', status_code=status.HTTP_404_NOT_FOUND)
+        if order.status not in ('DRAFT', 'CONFIRMED'):
+            return error_response(
+                f'Order in status {order.status} cannot be cancelled',
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            with transaction.atomic():
+                _release_order_reservations(order)
+                order.status = 'CANCELLED'
+                order.save(update_fields=['status', 'updated_at'])
+                order.payments.filter(status='PENDING').update(
+                    status='FAILED',
+                    notes='Order cancelled by customer',
+                    updated_at=timezone.now(),
+                )
+            return success_response('Order cancelled', {'order_number': order.order_number})
+        except Exception as e:
+            logger.error(f"Order cancellation failed: {str(e)}")
+            return error_response(
+                'Failed to cancel order',
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class StripeWebhookView(View):
+    """Checkout lifecycle callbacks from Stripe."""
+
+    HANDLERS = {
+        'checkout.session.completed': 'handle_checkout_session_completed',
+        'payment_intent.succeeded': 'handle_payment_intent_succeeded',
+        'payment_intent.payment_failed': 'handle_payment_intent_failed',
+        'charge.refunded': 'handle_charge_refunded',
+    }
+
+    def post(self, request):
+        payload = request.body
+        sig_header = request.META.get('HTTP_STRIPE_SIGNATURE', '')
+        try:
+            event = stripe.Webhook.construct_event(
+                payload, sig_header, _get_webhook_secret()
+            )
+        except ValueError:
+            return HttpResponse(status=400)
+        except stripe.error.SignatureVerificationError:
+            return HttpResponse(status=400)
+
+        handler_name = self.HANDLERS.get(event['type'])
+        if handler_name is None:
+            # Ack unhandled event types before touching the database.
+            return HttpResponse(status=200)
+        getattr(self, handler_name)(event)
+        return HttpResponse(status=200)
+
+    def handle_checkout_session_completed(self, event):
+        session = event['data']['object']
+        payment_id = session['metadata']['payment_id']
+        with transaction.atomic():
+            payment = Payment.objects.select_related(
+                'order', 'order__customer'
+            ).get(payment_id=payment_id)
+            order = payment.order
+            payment.status = 'COMPLETED'
+            payment.payment_date = timezone.now()
+            payment.completed_at = payment.payment_date
+            payment.gateway_response = dict(session)
+            payment.save(update_fields=[
+                'status', 'payment_date', 'completed_at', 'gateway_response',
+                'updated_at',
+            ])
+            order.status = 'CONFIRMED'
+            order.save(update_fields=['status', 'updated_at'])
+            # Side effects run on a worker only after the commit lands, so
+            # the transaction holds locks for nothing but the status flips
+            # and a rollback never leaves a phantom notification.
+            transaction.on_commit(
+                lambda: process_payment_confirmed_side_effects.delay(order.id)
+            )
+
+    def handle_payment_intent_succeeded(self, event):
+        intent = event['data']['object']
+        payment = Payment.objects.only('id', 'status', 'payment_date').get(
+            gateway_transaction_id=intent['id']
+        )
+        payment.status = 'COMPLETED'
+        payment.payment_date = timezone.now()
+        payment.save(update_fields=['status', 'payment_date', 'updated_at'])
+
+    def handle_payment_intent_failed(self, event):
+        intent = event['data']['object']
+        payment = Payment.objects.select_related('order').only(
+            'id', 'status', 'notes', 'order__id'
+        ).get(gateway_transaction_id=intent['id'])
+        payment.status = 'FAILED'
+        payment.notes = 'Payment failed at gateway'
+        payment.save(update_fields=['status', 'notes', 'updated_at'])
+        _release_order_reservations(payment.order)
+
+    def handle_charge_refunded(self, event):
+        charge = event['data']['object']
+        session_id = charge['payment_intent']
+        payment = Payment.objects.select_related('order').only(
+            'id', 'status', 'notes', 'order__id', 'order__status'
+        ).get(gateway_transaction_id=session_id)
+        order = payment.order
+        with transaction.atomic():
+            _release_order_reservations(order)
+            payment.status = 'REFUNDED'
+            payment.notes = 'Charge refunded by gateway'
+            payment.save(update_fields=['status', 'notes', 'updated_at'])
+            order.status = 'CANCELLED'
+            order.save(update_fields=['status', 'updated_at'])
+
+
+class PaymentSuccessView(View):
+    """Landing endpoint for Stripe's success redirect."""
+
+    def get(self, request):
+        session_id = request.GET.get('session_id')
+        if not session_id:
+            return JsonResponse(
+                {'success': False, 'message': 'session_id is required'}, status=400
+            )
+        if not _STRIPE_SESSION_RE.match(session_id):
+            return JsonResponse(
+                {'success': False, 'message': 'Invalid session id'}, status=400
+            )
+        # Success pages get reloaded and polled; a cached terminal state
+        # skips the ~200ms round trip to Stripe on repeat hits.
+        cache_key = cache_key_generator('stripe_session', session_id)
+        payment_status = get_cache_data(cache_key)
+        if payment_status is None:
+            try:
+                session = stripe.checkout.Session.retrieve(session_id)
+            except Exception as e:
+                logger.error(f"Stripe session lookup failed: {str(e)}")
+                return JsonResponse(
+                    {'success': False, 'message': 'Could not verify payment session'},
+                    status=400,
+                )
+            payment_status = session.payment_status
+            # Only terminal states are cacheable; 'unpaid' can flip to
+            # paid at any moment and must never be served stale. 'paid'
+            # is immutable so it can sit for an hour; 'expired' sessions
+            # are occasionally re-opened support-side, keep those short.
+            if payment_status == 'paid':
+                set_cache_data(cache_key, payment_status, 3600)
+            elif payment_status == 'expired':
+                set_cache_data(cache_key, payment_status, 300)
+        if payment_status == 'paid':
+            return JsonResponse({
+                'success': True,
+                'message': 'Payment completed',
+                'redirect_url': f'{settings.FRONTEND_URL}/orders',
+            })
+        return JsonResponse({
+            'success': False,
+            'message': f'Payment not completed (status: {payment_status})',
+        })
+
+
+class PaymentCancelView(View):
+    """Landing endpoint for Stripe's cancel redirect; rolls the order back."""
+
+    def get(self, request):
+        order_id = request.GET.get('order_id')
+        # The redirect only needs an acknowledgement; ownership is checked
+        # with a cheap EXISTS and the actual rollback (reservation release,
+        # status flip, payment fail-out) runs in a worker. The task re-checks
+        # DRAFT under a row lock, so racing the paid webhook or a double
+        # redirect stays safe.
+        try:
+            order = RentalOrder.objects.filter(
+                id=order_id, customer=request.user, is_deleted=False
+            ).only('id', 'status').first()
+        except (ValidationError, ValueError):
+            order = None
+        if order is None:
+            return JsonResponse(
+                {'success': False, 'message': 'Order not found'}, status=404
+            )
+        if order.status != 'DRAFT':
+            return JsonResponse(
+                {'success': False, 'message': 'Order cannot be cancelled'},
+                status=400,
+            )
+        cancel_order_task.delay(str(order.pk))
+        return JsonResponse({'success': True, 'message': 'Order cancelled'})
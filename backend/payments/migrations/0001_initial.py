@@ -0,0 +1,155 @@
+# Generated by Django 5.2.17 on 2026-08-28 18:51
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('orders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentGateway',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('gateway_type', models.CharField(choices=[('STRIPE', 'Stripe'), ('RAZORPAY', 'Razorpay'), ('INTERNAL', 'Internal')], max_length=20, unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('is_test_mode', models.BooleanField(default=True)),
+                ('config', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'db_table': 'payment_gateways',
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentMethod',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('name', models.CharField(max_length=100)),
+                ('provider', models.CharField(choices=[('STRIPE', 'Stripe'), ('RAZORPAY', 'Razorpay'), ('INTERNAL', 'Internal')], max_length=20)),
+                ('method_type', models.CharField(choices=[('CARD', 'Card'), ('UPI', 'UPI'), ('NETBANKING', 'Net Banking'), ('WALLET', 'Wallet'), ('CASH', 'Cash')], default='CARD', max_length=20)),
+                ('description', models.TextField(blank=True)),
+                ('config', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'db_table': 'payment_methods',
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentNotification',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('notification_type', models.CharField(choices=[('PAYMENT_CONFIRMATION', 'Payment Confirmation'), ('PAYMENT_REMINDER', 'Payment Reminder'), ('PAYMENT_FAILED', 'Payment Failed'), ('REFUND_PROCESSED', 'Refund Processed')], max_length=30)),
+                ('subject', models.CharField(blank=True, max_length=200)),
+                ('message', models.TextField(blank=True)),
+                ('is_sent', models.BooleanField(default=False)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'payment_notifications',
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentSchedule',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('due_date', models.DateTimeField()),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('description', models.CharField(blank=True, max_length=200)),
+                ('is_paid', models.BooleanField(default=False)),
+            ],
+            options={
+                'db_table': 'payment_schedules',
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentWebhook',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('provider', models.CharField(choices=[('STRIPE', 'Stripe'), ('RAZORPAY', 'Razorpay')], max_length=20)),
+                ('event_type', models.CharField(max_length=100)),
+                ('event_id', models.CharField(max_length=255)),
+                ('raw_payload', models.TextField(blank=True)),
+                ('signature', models.TextField(blank=True)),
+                ('headers', models.JSONField(blank=True, default=dict)),
+                ('processed', models.BooleanField(default=False)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('error_message', models.TextField(blank=True)),
+            ],
+            options={
+                'db_table': 'payment_webhooks',
+            },
+        ),
+        migrations.CreateModel(
+            name='Refund',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('refund_id', models.CharField(editable=False, max_length=40, unique=True)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('reason', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PROCESSING', 'Processing'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('gateway_refund_id', models.CharField(blank=True, max_length=255)),
+                ('gateway_response', models.JSONField(blank=True, default=dict)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'payment_refunds',
+            },
+        ),
+        migrations.CreateModel(
+            name='Payment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('payment_id', models.CharField(editable=False, max_length=40, unique=True)),
+                ('transaction_type', models.CharField(choices=[('RENTAL_PAYMENT', 'Rental Payment'), ('DEPOSIT', 'Deposit'), ('LATE_FEE', 'Late Fee'), ('REFUND', 'Refund')], default='RENTAL_PAYMENT', max_length=20)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PROCESSING', 'Processing'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed'), ('CANCELLED', 'Cancelled'), ('REFUNDED', 'Refunded')], default='PENDING', max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('tax_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('total_amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('currency', models.CharField(default='INR', max_length=3)),
+                ('gateway_transaction_id', models.CharField(blank=True, max_length=255)),
+                ('gateway_response', models.JSONField(blank=True, default=dict)),
+                ('payment_date', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payments', to='orders.rentalorder')),
+            ],
+            options={
+                'db_table': 'payments',
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='paymentmethod',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_deleted', False)), fields=['provider'], name='pm_active_by_provider'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 18:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_paymentmethod_pm_active_by_provider'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='paymentwebhook',
+            constraint=models.UniqueConstraint(fields=('provider', 'event_id'), name='uniq_webhook_event'),
+        ),
+    ]
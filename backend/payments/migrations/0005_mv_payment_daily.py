@@ -0,0 +1,29 @@
+"""Materialized view backing the payment analytics endpoints (PostgreSQL)."""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_paymentwebhook_uniq_webhook_event'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE MATERIALIZED VIEW mv_payment_daily AS
+                SELECT date_trunc('day', completed_at) AS day,
+                       payment_method_id,
+                       transaction_type,
+                       SUM(total_amount) AS total,
+                       COUNT(*) AS cnt,
+                       AVG(total_amount) AS avg
+                FROM payments
+                WHERE status = 'COMPLETED' AND is_deleted = false
+                GROUP BY 1, 2, 3;
+                CREATE UNIQUE INDEX mv_payment_daily_uniq
+                    ON mv_payment_daily (day, payment_method_id, transaction_type);
+            """,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS mv_payment_daily;",
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.17 on 2026-08-28 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_mv_payment_daily'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentDailyMV',
+            fields=[
+                ('day', models.DateTimeField(primary_key=True, serialize=False)),
+                ('transaction_type', models.CharField(max_length=20)),
+                ('total', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('cnt', models.BigIntegerField()),
+                ('avg', models.DecimalField(decimal_places=2, max_digits=14)),
+            ],
+            options={
+                'db_table': 'mv_payment_daily',
+                'managed': False,
+            },
+        ),
+    ]
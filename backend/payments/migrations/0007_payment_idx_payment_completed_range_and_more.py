@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-28 18:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_initial'),
+        ('payments', '0006_paymentdailymv'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'COMPLETED')), fields=['completed_at'], name='idx_payment_completed_range'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'COMPLETED')), fields=['payment_method', 'total_amount'], name='idx_payment_method_amount'),
+        ),
+    ]
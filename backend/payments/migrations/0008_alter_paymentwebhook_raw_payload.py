@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-28 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_payment_idx_payment_completed_range_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paymentwebhook',
+            name='raw_payload',
+            field=models.BinaryField(blank=True, default=b''),
+        ),
+    ]
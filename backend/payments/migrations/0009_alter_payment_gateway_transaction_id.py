@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-28 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_alter_paymentwebhook_raw_payload'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payment',
+            name='gateway_transaction_id',
+            field=models.CharField(blank=True, db_index=True, max_length=255),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-28 19:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_rentalorder_idx_order_customer_created_and_more'),
+        ('payments', '0009_alter_payment_gateway_transaction_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['order', 'is_deleted', '-created_at'], name='idx_payment_order_created'),
+        ),
+    ]
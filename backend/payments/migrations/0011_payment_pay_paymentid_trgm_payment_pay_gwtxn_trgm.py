@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-28 19:44
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_rentalorder_ro_ordernum_trgm'),
+        ('payments', '0010_payment_idx_payment_order_created'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # No-op off PostgreSQL; required before any gin_trgm_ops index.
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='payment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['payment_id'], name='pay_paymentid_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['gateway_transaction_id'], name='pay_gwtxn_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,303 @@
+"""Payment gateways, methods, transactions, refunds, webhooks and schedules."""
+import uuid
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+from django.utils import timezone
+
+from core.models import BaseModel
+
+
+class PaymentGateway(BaseModel):
+    """A configured payment gateway (Stripe, Razorpay or internal)."""
+    GATEWAY_TYPE_CHOICES = [
+        ('STRIPE', 'Stripe'),
+        ('RAZORPAY', 'Razorpay'),
+        ('INTERNAL', 'Internal'),
+    ]
+
+    gateway_type = models.CharField(max_length=20, choices=GATEWAY_TYPE_CHOICES, unique=True)
+    name = models.CharField(max_length=100)
+    is_test_mode = models.BooleanField(default=True)
+    config = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        db_table = 'payment_gateways'
+
+    def __str__(self):
+        return self.name
+
+
+class PaymentMethod(BaseModel):
+    """A payment method offered to customers (card, UPI, netbanking...)."""
+    PROVIDER_CHOICES = [
+        ('STRIPE', 'Stripe'),
+        ('RAZORPAY', 'Razorpay'),
+        ('INTERNAL', 'Internal'),
+    ]
+    METHOD_TYPE_CHOICES = [
+        ('CARD', 'Card'),
+        ('UPI', 'UPI'),
+        ('NETBANKING', 'Net Banking'),
+        ('WALLET', 'Wallet'),
+        ('CASH', 'Cash'),
+    ]
+
+    name = models.CharField(max_length=100)
+    provider = models.CharField(max_length=20, choices=PROVIDER_CHOICES)
+    method_type = models.CharField(max_length=20, choices=METHOD_TYPE_CHOICES, default='CARD')
+    description = models.TextField(blank=True)
+    config = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        db_table = 'payment_methods'
+        unique_together = ('provider', 'method_type', 'name')
+        indexes = [
+            # Partial index backing the by-provider listing, which only ever
+            # asks for active, non-deleted rows.
+            models.Index(
+                name='pm_active_by_provider',
+                fields=['provider'],
+                condition=models.Q(is_active=True, is_deleted=False),
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.name} ({self.provider})'
+
+
+class Payment(BaseModel):
+    """A payment attempt against a rental order."""
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('PROCESSING', 'Processing'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+        ('CANCELLED', 'Cancelled'),
+        ('REFUNDED', 'Refunded'),
+    ]
+    TRANSACTION_TYPE_CHOICES = [
+        ('RENTAL_PAYMENT', 'Rental Payment'),
+        ('DEPOSIT', 'Deposit'),
+        ('LATE_FEE', 'Late Fee'),
+        ('REFUND', 'Refund'),
+    ]
+
+    payment_id = models.CharField(max_length=40, unique=True, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name='payments'
+    )
+    order = models.ForeignKey(
+        'orders.RentalOrder', null=True, blank=True,
+        on_delete=models.SET_NULL, related_name='payments'
+    )
+    gateway = models.ForeignKey(
+        PaymentGateway, null=True, blank=True, on_delete=models.SET_NULL, related_name='payments'
+    )
+    payment_method = models.ForeignKey(
+        PaymentMethod, null=True, blank=True, on_delete=models.SET_NULL, related_name='payments'
+    )
+    transaction_type = models.CharField(
+        max_length=20, choices=TRANSACTION_TYPE_CHOICES, default='RENTAL_PAYMENT'
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    tax_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2)
+    currency = models.CharField(max_length=3, default='INR')
+    gateway_transaction_id = models.CharField(max_length=255, blank=True, db_index=True)
+    gateway_response = models.JSONField(default=dict, blank=True)
+    payment_date = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    notes = models.TextField(blank=True)
+
+    class Meta:
+        db_table = 'payments'
+        indexes = [
+            # Partial index over completed, non-deleted rows: the analytics
+            # endpoints always filter on exactly this predicate with an
+            # optional completed_at range.
+            models.Index(
+                name='idx_payment_completed_range',
+                fields=['completed_at'],
+                condition=models.Q(status='COMPLETED', is_deleted=False),
+            ),
+            # Covering index so the per-method aggregation can be satisfied
+            # with an index-only scan.
+            models.Index(
+                name='idx_payment_method_amount',
+                fields=['payment_method', 'total_amount'],
+                condition=models.Q(status='COMPLETED', is_deleted=False),
+            ),
+            # Order detail views list an order's payments newest first.
+            models.Index(
+                name='idx_payment_order_created',
+                fields=['order', 'is_deleted', '-created_at'],
+            ),
+            # Trigram indexes serving the fuzzy payment search (partial
+            # IDs pasted from Stripe dashboards and support tickets).
+            GinIndex(
+                name='pay_paymentid_trgm',
+                fields=['payment_id'],
+                opclasses=['gin_trgm_ops'],
+            ),
+            GinIndex(
+                name='pay_gwtxn_trgm',
+                fields=['gateway_transaction_id'],
+                opclasses=['gin_trgm_ops'],
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.payment_id} ({self.status})'
+
+    def save(self, *args, **kwargs):
+        if not self.payment_id:
+            self.payment_id = f'PAY-{uuid.uuid4().hex[:12].upper()}'
+        super().save(*args, **kwargs)
+
+
+class Refund(BaseModel):
+    """A refund issued against a completed payment."""
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('PROCESSING', 'Processing'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+    ]
+
+    refund_id = models.CharField(max_length=40, unique=True, editable=False)
+    payment = models.ForeignKey(Payment, on_delete=models.PROTECT, related_name='refunds')
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    reason = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    gateway_refund_id = models.CharField(max_length=255, blank=True)
+    gateway_response = models.JSONField(default=dict, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'payment_refunds'
+
+    def __str__(self):
+        return f'{self.refund_id} ({self.status})'
+
+    def save(self, *args, **kwargs):
+        if not self.refund_id:
+            self.refund_id = f'REF-{uuid.uuid4().hex[:12].upper()}'
+        super().save(*args, **kwargs)
+
+
+class PaymentWebhook(BaseModel):
+    """Raw webhook event received from a payment provider."""
+    PROVIDER_CHOICES = [
+        ('STRIPE', 'Stripe'),
+        ('RAZORPAY', 'Razorpay'),
+    ]
+
+    provider = models.CharField(max_length=20, choices=PROVIDER_CHOICES)
+    event_type = models.CharField(max_length=100)
+    event_id = models.CharField(max_length=255)
+    # Stored as raw bytes: payloads can reach hundreds of KB and an eager
+    # UTF-8 decode would double the allocation on every delivery.
+    raw_payload = models.BinaryField(default=b'', blank=True)
+    signature = models.TextField(blank=True)
+    headers = models.JSONField(default=dict, blank=True)
+    processed = models.BooleanField(default=False)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    error_message = models.TextField(blank=True)
+
+    class Meta:
+        db_table = 'payment_webhooks'
+        constraints = [
+            # Providers retry deliveries; dedupe them at the DB level.
+            models.UniqueConstraint(
+                fields=['provider', 'event_id'], name='uniq_webhook_event'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.provider} {self.event_type} ({self.event_id})'
+
+    @property
+    def raw_payload_text(self):
+        """Decoded payload for debugging / log inspection."""
+        return bytes(self.raw_payload).decode('utf-8')
+
+    def mark_as_processed(self):
+        self.processed = True
+        self.processed_at = timezone.now()
+        self.save(update_fields=['processed', 'processed_at', 'updated_at'])
+
+
+class PaymentDailyMV(models.Model):
+    """
+    Read-only mapping of the mv_payment_daily materialized view: completed
+    payment totals pre-aggregated per day, payment method and transaction
+    type. Refreshed hourly by the refresh_payment_daily_mv task.
+    """
+    day = models.DateTimeField(primary_key=True)
+    payment_method = models.ForeignKey(
+        PaymentMethod, null=True, on_delete=models.DO_NOTHING, related_name='+'
+    )
+    transaction_type = models.CharField(max_length=20)
+    total = models.DecimalField(max_digits=14, decimal_places=2)
+    cnt = models.BigIntegerField()
+    avg = models.DecimalField(max_digits=14, decimal_places=2)
+
+    class Meta:
+        managed = False
+        db_table = 'mv_payment_daily'
+
+
+class PaymentSchedule(BaseModel):
+    """A scheduled installment (deposit / balance) for an order."""
+    order = models.ForeignKey(
+        'orders.RentalOrder', on_delete=models.CASCADE, related_name='payment_schedules'
+    )
+    payment = models.ForeignKey(
+        Payment, null=True, blank=True, on_delete=models.SET_NULL, related_name='schedules'
+    )
+    due_date = models.DateTimeField()
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    description = models.CharField(max_length=200, blank=True)
+    is_paid = models.BooleanField(default=False)
+
+    class Meta:
+        db_table = 'payment_schedules'
+
+    def __str__(self):
+        return f'{self.order.order_number} due {self.due_date:%Y-%m-%d}'
+
+
+class PaymentNotification(BaseModel):
+    """Outbound notification about a payment event (email / portal)."""
+    NOTIFICATION_TYPE_CHOICES = [
+        ('PAYMENT_CONFIRMATION', 'Payment Confirmation'),
+        ('PAYMENT_REMINDER', 'Payment Reminder'),
+        ('PAYMENT_FAILED', 'Payment Failed'),
+        ('REFUND_PROCESSED', 'Refund Processed'),
+    ]
+
+    order = models.ForeignKey(
+        'orders.RentalOrder', null=True, blank=True,
+        on_delete=models.CASCADE, related_name='payment_notifications'
+    )
+    payment = models.ForeignKey(
+        Payment, null=True, blank=True, on_delete=models.CASCADE, related_name='notifications'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True,
+        on_delete=models.CASCADE, related_name='payment_notifications'
+    )
+    notification_type = models.CharField(max_length=30, choices=NOTIFICATION_TYPE_CHOICES)
+    subject = models.CharField(max_length=200, blank=True)
+    message = models.TextField(blank=True)
+    is_sent = models.BooleanField(default=False)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'payment_notifications'
+
+    def __str__(self):
+        return f'{self.notification_type} for {self.user}'
@@ -0,0 +1,123 @@
+"""Role-based permissions for the payments API."""
+from rest_framework import permissions
+
+from users.models import UserRole
+
+STAFF_ROLES = ['STAFF', 'MANAGER', 'ADMIN', 'SUPER_ADMIN']
+ADMIN_ROLES = ['ADMIN', 'SUPER_ADMIN']
+
+
+class RoleBasedPermission(permissions.BasePermission):
+    """
+    Grants access when the requesting user holds one of ``allowed_roles``.
+    Subclasses set ``allowed_roles``; None means any authenticated user.
+    """
+    allowed_roles = None
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+        if self.allowed_roles is None:
+            return True
+        return UserRole.objects.filter(
+            user=user, role__in=self.allowed_roles, is_active=True
+        ).exists()
+
+
+# Payment methods
+
+class PaymentMethodPermission(RoleBasedPermission):
+    """Any authenticated user may view payment methods."""
+    allowed_roles = None
+
+
+class PaymentMethodCreatePermission(RoleBasedPermission):
+    allowed_roles = STAFF_ROLES
+
+
+class PaymentMethodUpdatePermission(RoleBasedPermission):
+    allowed_roles = STAFF_ROLES
+
+
+class PaymentMethodDeletePermission(RoleBasedPermission):
+    allowed_roles = ADMIN_ROLES
+
+
+# Payment gateways
+
+class PaymentGatewayPermission(RoleBasedPermission):
+    allowed_roles = STAFF_ROLES
+
+
+class PaymentGatewayCreatePermission(RoleBasedPermission):
+    allowed_roles = ADMIN_ROLES
+
+
+class PaymentGatewayUpdatePermission(RoleBasedPermission):
+    allowed_roles = ADMIN_ROLES
+
+
+class PaymentGatewayDeletePermission(RoleBasedPermission):
+    allowed_roles = ADMIN_ROLES
+
+
+# Payments
+
+class PaymentPermission(RoleBasedPermission):
+    """Any authenticated user may view their own payments."""
+    allowed_roles = None
+
+
+class PaymentCreatePermission(RoleBasedPermission):
+    allowed_roles = None
+
+
+class PaymentUpdatePermission(RoleBasedPermission):
+    allowed_roles = STAFF_ROLES
+
+
+class PaymentDeletePermission(RoleBasedPermission):
+    allowed_roles = ADMIN_ROLES
+
+
+# Refunds
+
+class RefundPermission(RoleBasedPermission):
+    allowed_roles = None
+
+
+class RefundCreatePermission(RoleBasedPermission):
+    allowed_roles = STAFF_ROLES
+
+
+class RefundUpdatePermission(RoleBasedPermission):
+    allowed_roles = STAFF_ROLES
+
+
+class RefundDeletePermission(RoleBasedPermission):
+    allowed_roles = ADMIN_ROLES
+
+
+# Schedules / notifications
+
+class PaymentSchedulePermission(RoleBasedPermission):
+    """Customers see their own schedules; staff see everything."""
+    allowed_roles = None
+
+
+class PaymentNotificationPermission(RoleBasedPermission):
+    allowed_roles = None
+
+
+# Analytics
+
+class PaymentAnalyticsPermission(RoleBasedPermission):
+    allowed_roles = STAFF_ROLES
+
+
+# Webhooks
+
+class WebhookReplayPermission(RoleBasedPermission):
+    """Bulk webhook replay/backfill is an admin-only operation."""
+    allowed_roles = ADMIN_ROLES
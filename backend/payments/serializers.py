@@ -0,0 +1,129 @@
+"""Serializers for the payments API."""
+from rest_framework import serializers
+
+from .models import (
+    Payment,
+    PaymentGateway,
+    PaymentMethod,
+    PaymentNotification,
+    PaymentSchedule,
+    PaymentWebhook,
+    Refund,
+)
+
+
+class PaymentMethodListSerializer(serializers.ModelSerializer):
+    """Compact representation used on list endpoints."""
+
+    class Meta:
+        model = PaymentMethod
+        fields = ['id', 'name', 'provider', 'method_type', 'is_active']
+
+
+class PaymentMethodSerializer(serializers.ModelSerializer):
+    """Full representation used on detail endpoints and mutations."""
+
+    class Meta:
+        model = PaymentMethod
+        fields = [
+            'id', 'name', 'provider', 'method_type', 'description',
+            'config', 'is_active', 'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class PaymentGatewaySerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = PaymentGateway
+        fields = [
+            'id', 'gateway_type', 'name', 'is_test_mode', 'config',
+            'is_active', 'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class PaymentListSerializer(serializers.ModelSerializer):
+    """Compact representation used on list endpoints."""
+    user_email = serializers.EmailField(source='user.email', read_only=True)
+
+    class Meta:
+        model = Payment
+        fields = [
+            'id', 'payment_id', 'user_email', 'transaction_type', 'status',
+            'total_amount', 'currency', 'payment_date', 'created_at',
+        ]
+
+
+class PaymentSerializer(serializers.ModelSerializer):
+    """Full representation used on detail endpoints and mutations."""
+    user_email = serializers.EmailField(source='user.email', read_only=True)
+    gateway_name = serializers.CharField(source='gateway.name', read_only=True)
+
+    class Meta:
+        model = Payment
+        fields = [
+            'id', 'payment_id', 'user', 'user_email', 'order', 'gateway',
+            'gateway_name', 'payment_method', 'transaction_type', 'status',
+            'amount', 'tax_amount', 'total_amount', 'currency',
+            'gateway_transaction_id', 'gateway_response', 'payment_date',
+            'completed_at', 'notes', 'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'payment_id', 'created_at', 'updated_at']
+
+
+class RefundSerializer(serializers.ModelSerializer):
+    payment_reference = serializers.CharField(source='payment.payment_id', read_only=True)
+
+    class Meta:
+        model = Refund
+        fields = [
+            'id', 'refund_id', 'payment', 'payment_reference', 'amount',
+            'reason', 'status', 'gateway_refund_id', 'processed_at',
+            'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'refund_id', 'created_at', 'updated_at']
+
+
+class PaymentWebhookSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = PaymentWebhook
+        fields = [
+            'id', 'provider', 'event_type', 'event_id', 'processed',
+            'processed_at', 'error_message', 'created_at',
+        ]
+
+
+class PaymentScheduleSerializer(serializers.ModelSerializer):
+    order_number = serializers.CharField(source='order.order_number', read_only=True)
+
+    class Meta:
+        model = PaymentSchedule
+        fields = [
+            'id', 'order', 'order_number', 'payment', 'due_date', 'amount',
+            'description', 'is_paid', 'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class PaymentNotificationSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = PaymentNotification
+        fields = [
+            'id', 'order', 'payment', 'user', 'notification_type', 'subject',
+            'message', 'is_sent', 'sent_at', 'created_at',
+        ]
+        read_only_fields = ['id', 'created_at']
+
+
+class PaymentAnalyticsSerializer(serializers.Serializer):
+    """Shape of the revenue summary analytics payload."""
+    total_revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    total_transactions = serializers.IntegerField()
+    success_rate = serializers.FloatField()
+    average_transaction_value = serializers.DecimalField(max_digits=14, decimal_places=2)
+    currency = serializers.CharField()
+    period = serializers.CharField()
+    data_points = serializers.ListField(child=serializers.DictField(), allow_empty=True)
@@ -0,0 +1,16 @@
+"""Cache invalidation signals for the payments app."""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.utils import delete_cache_pattern
+
+from .models import Payment
+
+ANALYTICS_CACHE_PATTERN = 'pay:analytics:*'
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+def invalidate_analytics_cache(sender, **kwargs):
+    """Any payment mutation makes the cached analytics stale."""
+    delete_cache_pattern(ANALYTICS_CACHE_PATTERN)
@@ -0,0 +1,210 @@
+"""Background tasks for webhook ingestion and payment side effects."""
+import base64
+import json
+import logging
+
+from celery import shared_task
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hmac as chmac
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from .models import PaymentWebhook
+
+logger = logging.getLogger(__name__)
+
+# Raw webhook events are buffered in a Redis list by the HTTP handlers and
+# flushed to PostgreSQL in batches by the beat task below, so the webhook
+# endpoints never pay a DB round trip and inserts amortize transaction
+# overhead across the whole batch.
+WEBHOOK_BUFFER_KEY = 'webhook:ingest:buffer'
+WEBHOOK_BATCH_SIZE = 500
+
+
+def enqueue_raw_webhook(provider, event_id, event_type, payload, signature, headers):
+    """
+    Push one raw webhook event onto the ingestion buffer. ``payload`` is the
+    undecoded request body; it travels base64-wrapped because the buffer
+    envelope is JSON, and lands in the BinaryField untouched.
+    """
+    conn = get_redis_connection('default')
+    conn.rpush(
+        WEBHOOK_BUFFER_KEY,
+        json.dumps({
+            'provider': provider,
+            'event_id': event_id,
+            'event_type': event_type,
+            'payload_b64': base64.b64encode(payload).decode('ascii'),
+            'signature': signature,
+            'headers': headers,
+        }),
+    )
+
+
+@shared_task(bind=True, max_retries=5, default_retry_delay=30)
+def flush_webhook_buffer(self):
+    """
+    Drain up to WEBHOOK_BATCH_SIZE buffered events and persist them with a
+    single multi-row INSERT. Duplicate (provider, event_id) pairs are
+    dropped by the unique constraint via ignore_conflicts. The buffer is
+    the only copy of these events — the provider already got its 2xx —
+    so if the INSERT fails the drained rows go straight back onto the
+    list before the retry; the dedupe constraint makes the replay safe.
+    """
+    conn = get_redis_connection('default')
+    rows = conn.lpop(WEBHOOK_BUFFER_KEY, WEBHOOK_BATCH_SIZE)
+    if not rows:
+        return 0
+    objs = []
+    for row in rows:
+        try:
+            data = json.loads(row)
+            objs.append(PaymentWebhook(
+                provider=data['provider'],
+                event_id=data['event_id'],
+                event_type=data['event_type'],
+                raw_payload=base64.b64decode(data['payload_b64']),
+                signature=data.get('signature', ''),
+                headers=data.get('headers') or {},
+            ))
+        except Exception as e:
+            logger.exception("Dropping malformed buffered webhook: %s", e)
+    if not objs:
+        return 0
+    try:
+        PaymentWebhook.objects.bulk_create(
+            objs, batch_size=WEBHOOK_BATCH_SIZE, ignore_conflicts=True
+        )
+    except Exception as e:
+        conn.rpush(WEBHOOK_BUFFER_KEY, *rows)
+        logger.exception("Webhook flush failed, batch re-queued: %s", e)
+        raise self.retry(exc=e)
+    # Conflicting (duplicate) rows were dropped by ignore_conflicts, so only
+    # rows that really landed get dispatched for processing.
+    inserted_ids = PaymentWebhook.objects.filter(
+        pk__in=[o.pk for o in objs]
+    ).values_list('pk', flat=True)
+    for webhook_id in inserted_ids:
+        process_payment_webhook.delay(str(webhook_id))
+    return len(objs)
+
+
+def _hmac_sha256_matches(secret, message, signature_hex):
+    """
+    Constant-time HMAC-SHA256 check through the cryptography primitive,
+    which runs in OpenSSL (SHA-NI where available) and releases the GIL
+    for the digest — worth it on hundred-KB payloads under bursty
+    ingest. Malformed hex signatures simply fail verification.
+    """
+    try:
+        expected = bytes.fromhex(signature_hex)
+    except ValueError:
+        return False
+    h = chmac.HMAC(secret.encode(), hashes.SHA256())
+    h.update(message)
+    try:
+        h.verify(expected)
+    except InvalidSignature:
+        return False
+    return True
+
+
+def _verify_webhook_signature(webhook):
+    """HMAC-SHA256 verification of a stored webhook's signature."""
+    payload = bytes(webhook.raw_payload)
+    if webhook.provider == 'RAZORPAY':
+        secret = settings.RAZORPAY_WEBHOOK_SECRET
+        if not secret:
+            return True
+        return _hmac_sha256_matches(secret, payload, webhook.signature)
+    if webhook.provider == 'STRIPE':
+        secret = settings.STRIPE_WEBHOOK_SECRET
+        if not secret:
+            return True
+        # Stripe-Signature: t=<timestamp>,v1=<hex>,...
+        parts = dict(
+            part.split('=', 1) for part in webhook.signature.split(',') if '=' in part
+        )
+        timestamp, expected_sig = parts.get('t'), parts.get('v1')
+        if not timestamp or not expected_sig:
+            return False
+        signed = timestamp.encode() + b'.' + payload
+        return _hmac_sha256_matches(secret, signed, expected_sig)
+    return False
+
+
+@shared_task(bind=True, max_retries=5, default_retry_delay=30)
+def process_payment_webhook(self, webhook_id):
+    """
+    Verify and process one persisted webhook off the request thread, so
+    providers get their 2xx regardless of how long processing takes.
+    """
+    try:
+        webhook = PaymentWebhook.objects.get(pk=webhook_id)
+    except PaymentWebhook.DoesNotExist:
+        return
+    if webhook.processed:
+        return
+    try:
+        if not _verify_webhook_signature(webhook):
+            webhook.error_message = 'Signature verification failed'
+            webhook.save(update_fields=['error_message', 'updated_at'])
+            return
+        # TODO: dispatch business logic per event_type
+        webhook.mark_as_processed()
+    except Exception as e:
+        logger.exception("Webhook processing failed for %s: %s", webhook_id, e)
+        raise self.retry(exc=e)
+
+
+def _write_confirmation_notification(order):
+    from .models import PaymentNotification
+
+    PaymentNotification.objects.create(
+        order=order,
+        user=order.customer,
+        notification_type='PAYMENT_CONFIRMATION',
+        subject=f'Payment received for {order.order_number}',
+        message=(
+            f'Your payment of {order.total_amount} INR for order '
+            f'{order.order_number} has been received.'
+        ),
+    )
+    # TODO: send the confirmation email / SMS
+
+
+@shared_task
+def create_payment_confirmation_notification(order_id):
+    """
+    Write the payment-confirmation notification off the webhook thread.
+    Stripe only needs the 200 ack; the row (and any future email send)
+    has no business adding latency to the webhook response.
+    """
+    from orders.models import RentalOrder
+
+    order = RentalOrder.objects.select_related('customer').get(id=order_id)
+    _write_confirmation_notification(order)
+
+
+@shared_task
+def process_payment_confirmed_side_effects(order_id):
+    """
+    Everything a confirmed payment triggers beyond the status flip,
+    batched into a single worker hop scheduled via transaction.on_commit.
+    Currently the notification row; my_orders freshness is handled by
+    its ETag, so there is no list cache left to invalidate.
+    """
+    from orders.models import RentalOrder
+
+    order = RentalOrder.objects.select_related('customer').get(id=order_id)
+    _write_confirmation_notification(order)
+
+
+@shared_task
+def refresh_payment_daily_mv():
+    """Refresh the pre-aggregated analytics view without blocking readers."""
+    with connection.cursor() as cursor:
+        cursor.execute('REFRESH MATERIALIZED VIEW CONCURRENTLY mv_payment_daily')
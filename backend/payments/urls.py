@@ -0,0 +1,21 @@
+"""URL routes for the payments API."""
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from . import views
+
+router = DefaultRouter()
+router.register(r'methods', views.PaymentMethodViewSet, basename='payment-method')
+router.register(r'gateways', views.PaymentGatewayViewSet, basename='payment-gateway')
+router.register(r'transactions', views.PaymentViewSet, basename='payment')
+router.register(r'refunds', views.RefundViewSet, basename='refund')
+router.register(r'schedules', views.PaymentScheduleViewSet, basename='payment-schedule')
+router.register(r'notifications', views.PaymentNotificationViewSet, basename='payment-notification')
+router.register(r'analytics', views.PaymentAnalyticsViewSet, basename='payment-analytics')
+
+urlpatterns = [
+    path('', include(router.urls)),
+    path('webhooks/stripe/', views.stripe_webhook, name='stripe-webhook'),
+    path('webhooks/razorpay/', views.razorpay_webhook, name='razorpay-webhook'),
+    path('webhooks/bulk/', views.bulk_webhook, name='bulk-webhook'),
+]
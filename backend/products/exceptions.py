@@ -0,0 +1,105 @@
+"""Domain exceptions for the products app and their API translation."""
+from rest_framework import status
+from rest_framework.views import exception_handler
+
+from core.utils import error_response
+
+
+class ProductError(Exception):
+    """Base class for product domain errors."""
+
+
+class ProductNotFoundError(ProductError):
+    """Requested product does not exist or is deleted."""
+
+
+class ProductNotAvailableError(ProductError):
+    """Product exists but cannot currently be rented."""
+
+
+class ProductNotApprovedError(ProductError):
+    """Product is awaiting moderation and is not public yet."""
+
+
+class ProductQuantityError(ProductError):
+    """Requested quantity exceeds available stock."""
+
+
+class ProductPricingError(ProductError):
+    """No pricing rule matches the requested rental terms."""
+
+
+class ProductCategoryError(ProductError):
+    """Category is missing or cannot hold products."""
+
+
+class ProductMaintenanceError(ProductError):
+    """Product is under maintenance and blocked from rental."""
+
+
+class ProductReviewError(ProductError):
+    """Review cannot be created or updated."""
+
+
+# Exception class -> (message, error code, HTTP status, use str(exc) as the
+# message). Dispatch walks type(exc).__mro__ so subclasses inherit their
+# parent's entry; one dict probe per class beats a chain of isinstance
+# checks that every raised exception would pay in full when it falls
+# through to the generic branch.
+_EXC_MAP = {
+    ProductNotFoundError: (
+        'Product not found.', 'PRODUCT_NOT_FOUND',
+        status.HTTP_404_NOT_FOUND, False,
+    ),
+    ProductNotAvailableError: (
+        'Product is not available for rental.', 'PRODUCT_NOT_AVAILABLE',
+        status.HTTP_400_BAD_REQUEST, False,
+    ),
+    ProductNotApprovedError: (
+        'Product is pending approval.', 'PRODUCT_NOT_APPROVED',
+        status.HTTP_403_FORBIDDEN, False,
+    ),
+    ProductQuantityError: (
+        None, 'PRODUCT_QUANTITY_ERROR',
+        status.HTTP_400_BAD_REQUEST, True,
+    ),
+    ProductPricingError: (
+        None, 'PRODUCT_PRICING_ERROR',
+        status.HTTP_400_BAD_REQUEST, True,
+    ),
+    ProductCategoryError: (
+        'Invalid product category.', 'PRODUCT_CATEGORY_ERROR',
+        status.HTTP_400_BAD_REQUEST, False,
+    ),
+    ProductMaintenanceError: (
+        'Product is under maintenance.', 'PRODUCT_MAINTENANCE',
+        status.HTTP_409_CONFLICT, False,
+    ),
+    ProductReviewError: (
+        None, 'PRODUCT_REVIEW_ERROR',
+        status.HTTP_400_BAD_REQUEST, True,
+    ),
+    # Catch-all for domain errors without a more specific entry.
+    ProductError: (
+        'Product operation failed.', 'PRODUCT_ERROR',
+        status.HTTP_400_BAD_REQUEST, False,
+    ),
+}
+
+
+def product_exception_handler(exc, context):
+    """
+    DRF exception handler translating product domain errors into the
+    standard error envelope. Anything outside the table falls through to
+    DRF's default handler.
+    """
+    for cls in type(exc).__mro__:
+        entry = _EXC_MAP.get(cls)
+        if entry is not None:
+            message, code, status_code, use_exc_message = entry
+            return error_response(
+                str(exc) if use_exc_message and str(exc) else message,
+                errors={'code': code},
+                status_code=status_code,
+            )
+    return exception_handler(exc, context)
@@ -0,0 +1,93 @@
+"""Seed demo products and pricing rules for local and load testing."""
+import random
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils.text import slugify
+
+from products.models import Product, ProductCategory, ProductPricing
+
+CATEGORY_NAMES = ['Cameras', 'Drones', 'Lighting', 'Audio', 'Lenses']
+
+CUSTOMER_TYPES = [choice[0] for choice in ProductPricing.CUSTOMER_TYPE_CHOICES]
+DURATION_TYPES = [choice[0] for choice in ProductPricing.DURATION_TYPE_CHOICES]
+
+
+class Command(BaseCommand):
+    help = 'Generate demo products with a full pricing-rule matrix.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count', type=int, default=1000,
+            help='Number of products to create (default 1000).',
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        verbosity = options['verbosity']
+
+        User = get_user_model()
+        owner, _ = User.objects.get_or_create(
+            email='demo@borrowbit.local', defaults={'username': 'demo'}
+        )
+        categories = [
+            ProductCategory.objects.get_or_create(
+                name=name, defaults={'slug': slugify(name)}
+            )[0]
+            for name in CATEGORY_NAMES
+        ]
+
+        # Instances are accumulated and flushed in one multi-row INSERT per
+        # batch: seeding is bound by round-trip and commit latency, not by
+        # building Python objects. bulk_create skips Product.save(), so the
+        # slug is set here explicitly.
+        product_objs = []
+        for i in range(count):
+            category = random.choice(categories)
+            name = f'{category.name} unit {i}'
+            sku = f'SKU-{i:06d}'
+            product_objs.append(Product(
+                owner=owner,
+                category=category,
+                name=name,
+                sku=sku,
+                slug=Product.build_slug(name, sku),
+                total_quantity=random.randint(1, 20),
+                available_quantity=random.randint(1, 20),
+                deposit_amount=Decimal(random.randrange(500, 50000)) / 100,
+                admin_approved=True,
+            ))
+            if verbosity >= 2:
+                self.stdout.write(f'Prepared {name} ({sku})')
+        # On PostgreSQL bulk_create returns the instances with their PKs
+        # set, so the batch feeds the pricing generator directly.
+        products = Product.objects.bulk_create(product_objs, batch_size=1000)
+
+        rules_created = self.generate_pricing_rules(products)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(products)} products and {rules_created} pricing rules.'
+        ))
+
+    def generate_pricing_rules(self, products):
+        """
+        One rule per (customer type, duration type) pair per product,
+        accumulated across all products and flushed as one bulk_create —
+        the 16-rows-per-product matrix is the densest write path in the
+        command, so per-row INSERTs dominated its wall clock.
+        """
+        rules = [
+            ProductPricing(
+                product=product,
+                customer_type=customer_type,
+                duration_type=duration_type,
+                price=Decimal(random.randrange(100, 20000)) / 100,
+                discount_percentage=random.choice([0, 5, 10, 15]),
+            )
+            for product in products
+            for customer_type in CUSTOMER_TYPES
+            for duration_type in DURATION_TYPES
+        ]
+        ProductPricing.objects.bulk_create(rules, batch_size=5000)
+        return len(rules)
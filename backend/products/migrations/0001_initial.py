@@ -0,0 +1,126 @@
+# Generated by Django 5.2.17 on 2026-08-28 18:51
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('name', models.CharField(max_length=200)),
+                ('sku', models.CharField(max_length=50, unique=True)),
+                ('slug', models.SlugField(max_length=255, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('total_quantity', models.PositiveIntegerField(default=1)),
+                ('available_quantity', models.PositiveIntegerField(default=1)),
+                ('reserved_quantity', models.PositiveIntegerField(default=0)),
+                ('is_rentable', models.BooleanField(default=True)),
+                ('deposit_amount', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('admin_approved', models.BooleanField(default=False)),
+                ('is_featured', models.BooleanField(default=False)),
+            ],
+            options={
+                'db_table': 'products',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductCategory',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('slug', models.SlugField(max_length=120, unique=True)),
+                ('description', models.TextField(blank=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Product categories',
+                'db_table': 'product_categories',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductImage',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('image', models.ImageField(upload_to='products/')),
+                ('alt_text', models.CharField(blank=True, max_length=200)),
+                ('is_primary', models.BooleanField(default=False)),
+            ],
+            options={
+                'db_table': 'product_images',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductMaintenance',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('status', models.CharField(choices=[('SCHEDULED', 'Scheduled'), ('IN_PROGRESS', 'In Progress'), ('COMPLETED', 'Completed'), ('CANCELLED', 'Cancelled')], default='SCHEDULED', max_length=20)),
+                ('description', models.TextField(blank=True)),
+                ('scheduled_date', models.DateTimeField(blank=True, null=True)),
+                ('start_date', models.DateTimeField(blank=True, null=True)),
+                ('completed_date', models.DateTimeField(blank=True, null=True)),
+                ('cost', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+            ],
+            options={
+                'db_table': 'product_maintenance',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductPricing',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('customer_type', models.CharField(choices=[('REGULAR', 'Regular'), ('CORPORATE', 'Corporate'), ('VIP', 'VIP'), ('SEASONAL', 'Seasonal')], default='REGULAR', max_length=20)),
+                ('duration_type', models.CharField(choices=[('HOURLY', 'Hourly'), ('DAILY', 'Daily'), ('WEEKLY', 'Weekly'), ('MONTHLY', 'Monthly')], default='DAILY', max_length=20)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('discount_percentage', models.DecimalField(decimal_places=2, default=0, max_digits=5)),
+                ('valid_from', models.DateTimeField(blank=True, null=True)),
+                ('valid_until', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'product_pricing',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductReview',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('rating', models.PositiveSmallIntegerField(default=5)),
+                ('comment', models.TextField(blank=True)),
+                ('is_approved', models.BooleanField(default=False)),
+            ],
+            options={
+                'db_table': 'product_reviews',
+            },
+        ),
+    ]
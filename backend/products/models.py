@@ -0,0 +1,224 @@
+"""Rentable products, categories, pricing rules and maintenance records."""
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils.text import slugify
+
+from core.models import BaseModel
+
+
+class ProductCategory(BaseModel):
+    """Category grouping for rentable products."""
+    name = models.CharField(max_length=100, unique=True)
+    slug = models.SlugField(max_length=120, unique=True)
+    description = models.TextField(blank=True)
+    parent = models.ForeignKey(
+        'self', null=True, blank=True, on_delete=models.SET_NULL, related_name='children'
+    )
+
+    class Meta:
+        db_table = 'product_categories'
+        verbose_name_plural = 'Product categories'
+
+    def __str__(self):
+        return self.name
+
+    def get_products_count(self):
+        """Number of active, non-deleted products in this category."""
+        return self.products.filter(is_deleted=False, is_active=True).count()
+
+
+class ProductManager(models.Manager):
+    """Default manager with bulk inventory operations."""
+
+    def bulk_release(self, deltas):
+        """
+        Move reserved stock back to available for many products in a
+        single UPDATE. ``deltas`` maps product pk to quantity. The
+        F-expression arithmetic is race-safe on its own, so unlike
+        ``release_reservation`` no per-row SELECT ... FOR UPDATE is
+        taken — concurrent releases of the same SKU no longer serialize.
+        """
+        if not deltas:
+            return 0
+        release = models.Case(
+            *[models.When(pk=pk, then=qty) for pk, qty in deltas.items()],
+            output_field=models.IntegerField(),
+        )
+        return self.filter(pk__in=deltas).update(
+            available_quantity=models.F('available_quantity') + release,
+            reserved_quantity=models.F('reserved_quantity') - release,
+        )
+
+
+class Product(BaseModel):
+    """A rentable item with tracked inventory quantities."""
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='products'
+    )
+    category = models.ForeignKey(
+        ProductCategory, on_delete=models.PROTECT, related_name='products'
+    )
+    name = models.CharField(max_length=200)
+    sku = models.CharField(max_length=50, unique=True)
+    slug = models.SlugField(max_length=255, unique=True)
+    description = models.TextField(blank=True)
+    # Inventory
+    total_quantity = models.PositiveIntegerField(default=1)
+    available_quantity = models.PositiveIntegerField(default=1)
+    reserved_quantity = models.PositiveIntegerField(default=0)
+    # Rental config
+    is_rentable = models.BooleanField(default=True)
+    deposit_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    # Moderation / merchandising
+    admin_approved = models.BooleanField(default=False)
+    is_featured = models.BooleanField(default=False)
+
+    objects = ProductManager()
+
+    class Meta:
+        db_table = 'products'
+
+    def __str__(self):
+        return f'{self.name} ({self.sku})'
+
+    @staticmethod
+    def build_slug(name, sku):
+        """
+        Slug from name + sku. The name part is truncated first so the
+        sku suffix — the piece that keeps the slug unique without a
+        retry loop — always survives within the field's 255 chars.
+        """
+        return f'{slugify(name)[:190]}-{slugify(sku)}'[:255]
+
+    def save(self, *args, **kwargs):
+        # Generated once on the write path.
+        if not self.slug:
+            self.slug = self.build_slug(self.name, self.sku)
+        super().save(*args, **kwargs)
+
+    def reserve_quantity(self, quantity):
+        """Atomically move stock from available to reserved."""
+        with transaction.atomic():
+            product = Product.objects.select_for_update().get(pk=self.pk)
+            if product.available_quantity < quantity:
+                raise ValidationError(
+                    f'Only {product.available_quantity} units of {product.name} available.'
+                )
+            product.available_quantity -= quantity
+            product.reserved_quantity += quantity
+            product.save(update_fields=['available_quantity', 'reserved_quantity', 'updated_at'])
+
+    def release_reservation(self, quantity):
+        """Atomically move stock back from reserved to available."""
+        with transaction.atomic():
+            product = Product.objects.select_for_update().get(pk=self.pk)
+            released = min(quantity, product.reserved_quantity)
+            product.reserved_quantity -= released
+            product.available_quantity += released
+            product.save(update_fields=['available_quantity', 'reserved_quantity', 'updated_at'])
+
+
+class ProductPricing(BaseModel):
+    """Time-dependent pricing rule for a product and customer segment."""
+    CUSTOMER_TYPE_CHOICES = [
+        ('REGULAR', 'Regular'),
+        ('CORPORATE', 'Corporate'),
+        ('VIP', 'VIP'),
+        ('SEASONAL', 'Seasonal'),
+    ]
+    DURATION_TYPE_CHOICES = [
+        ('HOURLY', 'Hourly'),
+        ('DAILY', 'Daily'),
+        ('WEEKLY', 'Weekly'),
+        ('MONTHLY', 'Monthly'),
+    ]
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='pricing_rules')
+    customer_type = models.CharField(max_length=20, choices=CUSTOMER_TYPE_CHOICES, default='REGULAR')
+    duration_type = models.CharField(max_length=20, choices=DURATION_TYPE_CHOICES, default='DAILY')
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    discount_percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    valid_from = models.DateTimeField(null=True, blank=True)
+    valid_until = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'product_pricing'
+        unique_together = ('product', 'customer_type', 'duration_type')
+
+    def __str__(self):
+        return f'{self.product.name} {self.customer_type}/{self.duration_type}: {self.price}'
+
+
+class ProductImage(BaseModel):
+    """Image attached to a product listing."""
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='images')
+    image = models.ImageField(upload_to='products/')
+    alt_text = models.CharField(max_length=200, blank=True)
+    is_primary = models.BooleanField(default=False)
+
+    class Meta:
+        db_table = 'product_images'
+
+    def __str__(self):
+        return f'Image for {self.product.name}'
+
+
+class ProductReview(BaseModel):
+    """Customer review of a rented product."""
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='reviews')
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='product_reviews'
+    )
+    rating = models.PositiveSmallIntegerField(default=5)
+    comment = models.TextField(blank=True)
+    is_approved = models.BooleanField(default=False)
+
+    class Meta:
+        db_table = 'product_reviews'
+        unique_together = ('product', 'user')
+
+    def __str__(self):
+        return f'{self.product.name} - {self.rating}/5'
+
+
+class ProductMaintenance(BaseModel):
+    """Scheduled or ongoing maintenance for a product."""
+    STATUS_CHOICES = [
+        ('SCHEDULED', 'Scheduled'),
+        ('IN_PROGRESS', 'In Progress'),
+        ('COMPLETED', 'Completed'),
+        ('CANCELLED', 'Cancelled'),
+    ]
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='maintenance_records')
+    assigned_technician = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True,
+        on_delete=models.SET_NULL, related_name='assigned_maintenance'
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='SCHEDULED')
+    description = models.TextField(blank=True)
+    scheduled_date = models.DateTimeField(null=True, blank=True)
+    start_date = models.DateTimeField(null=True, blank=True)
+    completed_date = models.DateTimeField(null=True, blank=True)
+    cost = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'product_maintenance'
+
+    def __str__(self):
+        return f'{self.product.name} maintenance ({self.status})'
+
+    def start_maintenance(self):
+        """Transition SCHEDULED -> IN_PROGRESS."""
+        from django.utils import timezone
+        self.status = 'IN_PROGRESS'
+        self.start_date = timezone.now()
+        self.save(update_fields=['status', 'start_date', 'updated_at'])
+
+    def complete_maintenance(self):
+        """Transition IN_PROGRESS -> COMPLETED."""
+        from django.utils import timezone
+        self.status = 'COMPLETED'
+        self.completed_date = timezone.now()
+        self.save(update_fields=['status', 'completed_date', 'updated_at'])
@@ -0,0 +1,59 @@
+"""User accounts and role assignments."""
+import uuid
+
+from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+
+class User(AbstractUser):
+    """BorrowBit account. Email is the login identifier."""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    email = models.EmailField(unique=True)
+    phone_number = models.CharField(max_length=20, blank=True)
+    is_verified = models.BooleanField(default=False)
+
+    USERNAME_FIELD = 'email'
+    REQUIRED_FIELDS = ['username']
+
+    class Meta:
+        db_table = 'users'
+        indexes = [
+            # Trigram indexes backing the fuzzy customer search on the
+            # order and payment list endpoints.
+            GinIndex(name='user_email_trgm', fields=['email'], opclasses=['gin_trgm_ops']),
+            GinIndex(name='user_first_trgm', fields=['first_name'], opclasses=['gin_trgm_ops']),
+            GinIndex(name='user_last_trgm', fields=['last_name'], opclasses=['gin_trgm_ops']),
+        ]
+
+    def __str__(self):
+        return self.email
+
+
+class UserRole(models.Model):
+    """
+    Role assignment for a user. A user can hold several roles at once
+    (e.g. STAFF + MANAGER); authorization checks look at the active ones.
+    """
+    ROLE_CHOICES = [
+        ('CUSTOMER', 'Customer'),
+        ('STAFF', 'Staff'),
+        ('MANAGER', 'Manager'),
+        ('ADMIN', 'Admin'),
+        ('SUPER_ADMIN', 'Super Admin'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='user_roles')
+    role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='CUSTOMER')
+    permissions = models.JSONField(default=dict, blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'user_roles'
+        unique_together = ('user', 'role')
+
+    def __str__(self):
+        return f'{self.user.email} - {self.role}'